@@ -1,5 +1,6 @@
 import numpy as np
 from .base import Activation
+from .helpers import reuse_buffer
 
 class Linear(Activation):
 
@@ -64,7 +65,10 @@ class ReLU(Activation):
         """
         # Store inputs for later use (backpropagation)
         self.inputs = inputs
-        self.output = np.maximum(0, inputs)
+
+        # Output array is reused between passes with the same batch size
+        self._output_buf = reuse_buffer(getattr(self, '_output_buf', None), inputs.shape, inputs.dtype)
+        self.output = np.maximum(inputs, 0, out=self._output_buf)
 
     def backward(self, delta: np.ndarray) -> None:
         """
@@ -104,7 +108,14 @@ class Sigmoid(Activation):
         -------
         None
         """
-        self.output = 1 / (1 + np.exp(-inputs))
+        # Output array is reused between passes with the same batch size
+        self._output_buf = reuse_buffer(getattr(self, '_output_buf', None), inputs.shape, np.result_type(inputs, 1.0))
+
+        # 1 / (1 + exp(-inputs)), every step written to the same array
+        self.output = np.negative(inputs, out=self._output_buf)
+        np.exp(self.output, out=self.output)
+        self.output += 1
+        np.reciprocal(self.output, out=self.output)
 
     def backward(self, delta: np.ndarray) -> None:
         """
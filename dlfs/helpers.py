@@ -22,10 +22,8 @@ def dilate(arr: np.ndarray, stride: int) -> np.ndarray:
     dilated_shape = (arr.shape[0] - 1) * stride + 1, (arr.shape[1] - 1) * stride + 1
     dilated = np.zeros(dilated_shape)
     
-    # Place the original array elements into the dilated array
-    for i in range(arr.shape[0]):
-        for j in range(arr.shape[1]):
-            dilated[i * stride, j * stride] = arr[i, j]
+    # Place the original array elements into every stride-th row and column of the dilated array
+    dilated[::stride, ::stride] = arr
     
     return dilated
 
@@ -61,6 +59,107 @@ def pad_to_shape(arr: np.ndarray, target_shape: tuple) -> np.ndarray:
     padded = np.pad(arr, ((pad_top, pad_bottom), (pad_left, pad_right)), mode='constant', constant_values=0)
     return padded
 
+def im2col(inputs: np.ndarray, kernel_size: int, stride: int = 1, out: np.ndarray = None) -> np.ndarray:
+    """
+    Rearranges every kernel-sized patch of a batch of images into a column of a matrix.
+
+    Parameters
+    ----------
+    inputs : np.ndarray
+        Array of shape (n_samples, channels, height, width).
+
+    kernel_size : int
+        Dimension of a single kernel, square array of shape (kernel_size, kernel_size).
+
+    stride : int, default=1
+        Step size at which the kernel moves across the input.
+
+    out : np.ndarray, default=None
+        C-contiguous array of the result shape to write to. A new array is allocated if not given.
+
+    Returns
+    -------
+    cols : np.ndarray
+        Array of shape (channels * kernel_size * kernel_size, n_samples * output_height * output_width).
+    """
+    # View of every patch, shape (n_samples, channels, output_height, output_width, kernel_size, kernel_size)
+    patches = np.lib.stride_tricks.sliding_window_view(inputs, (kernel_size, kernel_size), axis=(2, 3))[:, :, ::stride, ::stride]
+
+    # Move channel and kernel axes to the front so each column holds one patch
+    patches = patches.transpose(1, 4, 5, 0, 2, 3)
+    if out is None:
+        return patches.reshape(inputs.shape[1] * kernel_size * kernel_size, -1)
+
+    out.reshape(patches.shape)[...] = patches
+    return out
+
+def col2im(cols: np.ndarray, input_shape: tuple, kernel_size: int, stride: int = 1, out: np.ndarray = None) -> np.ndarray:
+    """
+    Inverse of im2col, accumulates every column back into the patch of the image it was taken from.
+
+    Parameters
+    ----------
+    cols : np.ndarray
+        Array of shape (channels * kernel_size * kernel_size, n_samples * output_height * output_width).
+
+    input_shape : tuple
+        Shape of the reconstructed array (n_samples, channels, height, width).
+
+    kernel_size : int
+        Dimension of a single kernel, square array of shape (kernel_size, kernel_size).
+
+    stride : int, default=1
+        Step size at which the kernel moves across the input.
+
+    out : np.ndarray, default=None
+        Array of shape input_shape to write to. A new array is allocated if not given.
+
+    Returns
+    -------
+    arr : np.ndarray
+        Array of shape input_shape.
+    """
+    n_samples, channels, height, width = input_shape
+    output_height = (height - kernel_size) // stride + 1
+    output_width = (width - kernel_size) // stride + 1
+
+    cols = cols.reshape(channels, kernel_size, kernel_size, n_samples, output_height, output_width)
+    if out is None:
+        arr = np.zeros(input_shape, dtype=cols.dtype)
+    else:
+        arr = out
+        arr.fill(0)
+
+    # Patches overlap, but a fixed kernel offset touches every position at most once
+    for dy in range(kernel_size):
+        for dx in range(kernel_size):
+            arr[:, :, dy:dy + stride * output_height:stride, dx:dx + stride * output_width:stride] += cols[:, dy, dx].transpose(1, 0, 2, 3)
+
+    return arr
+
+def reuse_buffer(buffer: np.ndarray, shape: tuple, dtype: np.dtype) -> np.ndarray:
+    """
+    Returns buffer if it matches the requested shape and type, otherwise allocates a new uninitialized array.
+
+    Parameters
+    ----------
+    buffer : np.ndarray
+        Previously allocated array, can be None.
+
+    shape : tuple
+        Requested shape.
+
+    dtype : np.dtype
+        Requested data type.
+
+    Returns
+    -------
+    buffer : np.ndarray
+    """
+    if buffer is None or buffer.shape != tuple(shape) or buffer.dtype != dtype:
+        buffer = np.empty(shape, dtype=dtype)
+    return buffer
+
 def timeit(name):
 
     def timed(func):
@@ -1,11 +1,12 @@
+from numbers import Integral
 import numpy as np
-from scipy import signal
+from scipy import fft
 from .base import Layer
-from .helpers import dilate, pad_to_shape
+from .helpers import im2col, col2im, reuse_buffer
 
 class DenseLayer(Layer):
     
-    def __init__(self, n_inputs: int, n_neurons: int) -> None:
+    def __init__(self, n_inputs: int, n_neurons: int, dtype: np.dtype = np.float32) -> None:
         """
         Fully connected dense layer of neurons.
 
@@ -17,6 +18,9 @@ class DenseLayer(Layer):
         n_neurons : int
             Number of neurons the layer consists of.
 
+        dtype : numpy.dtype, default=numpy.float32
+            Data type of layer parameters, inputs and gradients are cast to it.
+
         Attributes
         ----------
         weights : numpy.ndarray
@@ -26,10 +30,17 @@ class DenseLayer(Layer):
             Vector of bias coefficients.
         """
 
+        self.dtype = np.dtype(dtype)
+
         # Weights are randomly initialized, small random numbers seem to work well
-        self.weights = 0.1 * np.random.randn(n_inputs, n_neurons)
+        self.weights = (0.1 * np.random.randn(n_inputs, n_neurons)).astype(self.dtype, copy=False)
         # Bias vector is initialized to a zero vector
-        self.biases = np.zeros(n_neurons)
+        self.biases = np.zeros(n_neurons, dtype=self.dtype)
+
+        # Output and gradient arrays are reused between passes with the same batch size
+        self._output_buf = None
+        self._dweights_buf = None
+        self._dinputs_buf = None
 
     def forward(self, inputs: np.ndarray) -> None:
         """
@@ -44,10 +55,19 @@ class DenseLayer(Layer):
         -------
         None
         """
+        # Cast inputs once so the whole pass runs in the layer's precision
+        if inputs.dtype != self.dtype:
+            inputs = inputs.astype(self.dtype)
+
         # Store inputs for later use (backpropagation)
         self.inputs = inputs
-        self.output = np.dot(inputs, self.weights) + self.biases
 
+        output_shape = (*inputs.shape[:-1], self.weights.shape[1])
+        self._output_buf = reuse_buffer(self._output_buf, output_shape, np.result_type(inputs, self.weights))
+
+        np.matmul(inputs, self.weights, out=self._output_buf)
+        self._output_buf += self.biases
+        self.output = self._output_buf
 
     def backward(self, delta: np.ndarray) -> None:
         """
@@ -62,26 +82,29 @@ class DenseLayer(Layer):
         -------
         None
         """
+        # Gradients are kept in the layer's precision so parameter updates don't change it
+        if delta.dtype != self.dtype:
+            delta = delta.astype(self.dtype)
+
         # 2D case (n_samples, n_inputs)
         if len(delta.shape) == 2:
-            self.dweights = np.dot(self.inputs.T, delta)
+            self._dweights_buf = reuse_buffer(self._dweights_buf, self.weights.shape, np.result_type(self.inputs, delta))
+            self._dinputs_buf = reuse_buffer(self._dinputs_buf, self.inputs.shape, np.result_type(delta, self.weights))
+
+            self.dweights = np.matmul(self.inputs.T, delta, out=self._dweights_buf)
             self.dbiases = np.sum(delta, axis=0)
-            self.dinputs = np.dot(delta, self.weights.T)
+            self.dinputs = np.matmul(delta, self.weights.T, out=self._dinputs_buf)
         
         # 3D case (n_samples, n_timestamps, n_inputs), used with RNN sequences
         if len(delta.shape) == 3:
-            self.dweights = np.zeros_like(self.weights)
-            self.dbiases = np.zeros_like(self.biases)
-            self.dinputs = np.zeros_like(self.inputs)
-
-            for i in range(delta.shape[0]):
-                self.dweights += np.dot(self.inputs[i].T, delta[i])
-                self.dbiases += np.sum(delta[i], axis=0)
-                self.dinputs += np.dot(delta[i], self.weights.T)
+            # Samples and timestamps are contracted together, without looping through samples
+            self.dweights = np.tensordot(self.inputs, delta, axes=([0, 1], [0, 1]))
+            self.dbiases = np.sum(delta, axis=(0, 1))
+            self.dinputs = np.tensordot(delta, self.weights, axes=([2], [1]))
 
 class ConvolutionalLayer(Layer):
 
-    def __init__(self, input_shape: tuple, output_channels: int, kernel_size: int, stride: int = 1, padding: int = 0) -> None:
+    def __init__(self, input_shape: tuple, output_channels: int, kernel_size: int, stride: int = 1, padding: int = 0, dtype: np.dtype = np.float32) -> None:
         """
         Convolutional layer.
 
@@ -101,6 +124,9 @@ class ConvolutionalLayer(Layer):
 
         padding : int, default=0
             Amount of padding added to input.
+
+        dtype : numpy.dtype, default=numpy.float32
+            Data type of layer parameters, inputs and gradients are cast to it.
         """
         # Unpack input_shape tuple
         input_channels, input_height, input_width = input_shape
@@ -110,18 +136,34 @@ class ConvolutionalLayer(Layer):
         self.kernel_size = kernel_size
         self.stride = stride
         self.padding = padding
+        self.dtype = np.dtype(dtype)
 
         # Calculate output width and height
-        output_height = int((input_height - kernel_size + 2 * padding) / stride) + 1
-        output_width = int((input_width - kernel_size + 2 * padding) / stride) + 1
+        output_height = (input_height - kernel_size + 2 * padding) // stride + 1
+        output_width = (input_width - kernel_size + 2 * padding) // stride + 1
 
         # Create output and kernel shapes
         self.output_shape = (output_channels, output_height, output_width)
         self.kernels_shape = (output_channels, input_channels, kernel_size, kernel_size)
 
         # Initialize layer parameters
-        self.kernels = np.random.randn(*self.kernels_shape)
-        self.biases = np.random.randn(*self.output_shape)
+        self.kernels = np.random.randn(*self.kernels_shape).astype(self.dtype, copy=False)
+        self.biases = np.random.randn(*self.output_shape).astype(self.dtype, copy=False)
+
+        # Large kernels are cheaper to apply in the frequency domain, where correlation becomes a pointwise product
+        padded_height = input_height + 2 * padding
+        padded_width = input_width + 2 * padding
+        self.use_fft = stride == 1 and kernel_size ** 2 > 3 * np.log2(padded_height * padded_width)
+        self.fft_shape = (fft.next_fast_len(padded_height, real=True), fft.next_fast_len(padded_width, real=True))
+
+        # Output, gradient and intermediate matrices are reused between passes with the same batch size
+        self._cols_buf = None
+        self._matrix_buf = None
+        self._output_buf = None
+        self._dkernels_buf = None
+        self._dbiases_buf = None
+        self._dcols_buf = None
+        self._dinputs_buf = None
 
     def forward(self, inputs: np.ndarray) -> None:
         """
@@ -139,25 +181,36 @@ class ConvolutionalLayer(Layer):
         # Number of samples, first dimension
         n_samples = inputs.shape[0]
 
+        # Cast inputs once so the whole pass runs in the layer's precision
+        if inputs.dtype != self.dtype:
+            inputs = inputs.astype(self.dtype)
+
         # Store inputs for later use
         self.inputs = inputs
 
-        # Output is 4D tensor of shape (n_samples, output_channels, height, width)
-        self.output = np.zeros((n_samples, *self.output_shape))
+        if self.padding:
+            inputs = np.pad(inputs, ((0, 0), (0, 0), (self.padding, self.padding), (self.padding, self.padding)), mode='constant')
 
-        # Add bias to output
-        self.output += self.biases
+        if self.use_fft:
+            output = self._forward_fft(inputs)
 
-        # Loop through each sample, output channel and input channel
-        for i in range(n_samples):
-            for j in range(self.output_channels):
-                for k in range(self.input_channels):
-                    if self.padding:
-                        inputs = np.pad(self.inputs[i, k], pad_width=self.padding, mode='constant')
-                    else:
-                        inputs = self.inputs[i, k].copy()
-                    # Output is the cross correlation in valid mode between the input and kernel
-                    self.output[i, j] += signal.correlate2d(inputs, self.kernels[j, k], mode="valid")[::self.stride, ::self.stride]
+        else:
+            # Every patch the kernels slide over becomes a column, stored for backpropagation
+            n_positions = n_samples * self.output_shape[1] * self.output_shape[2]
+            self._cols_buf = reuse_buffer(self._cols_buf, (self.input_channels * self.kernel_size ** 2, n_positions), inputs.dtype)
+            self.cols = im2col(inputs, self.kernel_size, self.stride, out=self._cols_buf)
+
+            # Each row of the flattened kernels is one output channel
+            kernels = self.kernels.reshape(self.output_channels, -1)
+
+            # Cross correlation of all samples and channels is a single matrix product
+            self._matrix_buf = reuse_buffer(self._matrix_buf, (self.output_channels, n_positions), np.result_type(kernels, self.cols))
+            output = np.dot(kernels, self.cols, out=self._matrix_buf).reshape(self.output_channels, n_samples, *self.output_shape[1:])
+            output = output.transpose(1, 0, 2, 3)
+
+        # Output is 4D tensor of shape (n_samples, output_channels, height, width)
+        self._output_buf = reuse_buffer(self._output_buf, (n_samples, *self.output_shape), np.result_type(output, self.biases))
+        self.output = np.add(output, self.biases, out=self._output_buf)
 
     def backward(self, delta: np.ndarray) -> None:
         """
@@ -172,135 +225,104 @@ class ConvolutionalLayer(Layer):
         -------
         None
         """
-        # Initialize gradient attributes
-        self.dkernels = np.zeros(self.kernels.shape)
-        self.dbiases = np.zeros(self.biases.shape)
-        self.dinputs = np.zeros(self.inputs.shape)
-
         # Number of samples, first dimension
         n_samples = self.inputs.shape[0]
 
-        # Loop through each sample, output channel and input channel
-        for i in range(n_samples):
+        # Gradients are kept in the layer's precision so parameter updates don't change it
+        if delta.dtype != self.dtype:
+            delta = delta.astype(self.dtype)
+
+        # Gradient with respect to biases is the sum of deltas
+        self._dbiases_buf = reuse_buffer(self._dbiases_buf, self.biases.shape, delta.dtype)
+        self.dbiases = np.sum(delta, axis=0, out=self._dbiases_buf)
 
-            # Gradient with respect to biases is the sum of deltas
-            self.dbiases += delta[i]
+        input_height, input_width = self.inputs.shape[-2:]
+        padded_shape = (n_samples, self.input_channels, input_height + 2 * self.padding, input_width + 2 * self.padding)
 
-            for j in range(self.output_channels):
-                for k in range(self.input_channels):
+        if self.use_fft:
+            self.dkernels, self.dinputs = self._backward_fft(delta, padded_shape)
 
-                    if self.padding:
-                        
-                        input_padded = np.pad(self.inputs[i, k], pad_width=self.padding)
+        else:
+            # Delta as a matrix of shape (output_channels, n_samples * height * width), matching the columns of the forward product
+            self._matrix_buf = reuse_buffer(self._matrix_buf, (self.output_channels, self.cols.shape[1]), delta.dtype)
+            self._matrix_buf.reshape(self.output_channels, n_samples, *delta.shape[2:])[...] = delta.transpose(1, 0, 2, 3)
+            delta = self._matrix_buf
 
-                        dkernels = self._calculate_kernel_gradient(input_padded, delta[i, j], self.kernels[j, k], stride=self.stride)
-                        dinputs = self._calculate_input_gradient(input_padded, delta[i, j], self.kernels[j, k], stride=self.stride)
+            # Gradient with respect to kernels is the product of delta and the input patches
+            kernels = self.kernels.reshape(self.output_channels, -1)
+            self._dkernels_buf = reuse_buffer(self._dkernels_buf, kernels.shape, np.result_type(delta, self.cols))
+            self.dkernels = np.dot(delta, self.cols.T, out=self._dkernels_buf).reshape(self.kernels.shape)
 
-                        # Since padding was used gradient needs to be unpadded to match shape
-                        dinputs = dinputs[self.padding:-self.padding, self.padding:-self.padding]
+            # Gradient with respect to input patches, folded back into the (padded) input shape
+            self._dcols_buf = reuse_buffer(self._dcols_buf, self.cols.shape, np.result_type(kernels, delta))
+            dcols = np.dot(kernels.T, delta, out=self._dcols_buf)
 
-                    else:
-                        dkernels = self._calculate_kernel_gradient(self.inputs[i, k], delta[i, j], self.kernels[j, k], stride=self.stride)
-                        dinputs = self._calculate_input_gradient(self.inputs[i, k], delta[i, j], self.kernels[j, k], stride=self.stride)
+            self._dinputs_buf = reuse_buffer(self._dinputs_buf, padded_shape, dcols.dtype)
+            self.dinputs = col2im(dcols, padded_shape, self.kernel_size, self.stride, out=self._dinputs_buf)
 
-                    self.dkernels[j, k] += dkernels
-                    self.dinputs[i, k] += dinputs
+        # Since padding was used gradient needs to be unpadded to match shape
+        if self.padding:
+            self.dinputs = self.dinputs[:, :, self.padding:-self.padding, self.padding:-self.padding]
 
-    def _calculate_kernel_gradient(self, inputs: np.ndarray, delta: np.ndarray, kernel: np.ndarray, stride: int = 1) -> np.ndarray:
+    def _forward_fft(self, inputs: np.ndarray) -> np.ndarray:
         """
-        Helper method for calculating kernel gradient.
+        Helper method for calculating the cross correlation of inputs and kernels in the frequency domain.
+        Spectra of the inputs and kernels are stored for backpropagation.
 
         Parameters
         ----------
         inputs : np.ndarray
-            Current sample the gradient is calculated for.
-
-        delta : np.ndarray
-            Accumulated gradient obtained by backpropagation.
-
-        kernel : np.ndarray
-            Kernel used in convolutional layer.
-
-        stride : int, default=1
-            Step size at which the kernel moves across the input.
+            Padded input matrix.
 
         Returns
         -------
-        kernel_grad : np.ndarray
-            Kernel gradient.
+        output : np.ndarray
+            Cross correlation in valid mode, without biases.
         """
+        input_height, input_width = inputs.shape[-2:]
 
-        if stride > 1:
+        # Transforms of all samples and channels are split across every CPU core (workers=-1)
+        self.inputs_fft = fft.rfftn(inputs, self.fft_shape, axes=(2, 3), workers=-1)
+        self.kernels_fft = fft.rfftn(self.kernels, self.fft_shape, axes=(2, 3), workers=-1)
 
-            # If stride is present delta needs to be dilated
-            delta_dilated = dilate(delta, stride)
+        # Cross correlation is a product with the conjugate kernel spectrum, summed over input channels
+        output_fft = np.einsum('ncij,ocij->noij', self.inputs_fft, np.conj(self.kernels_fft), optimize=True)
+        output = fft.irfftn(output_fft, self.fft_shape, axes=(2, 3), workers=-1)
 
-            delta_dilated_height, delta_dilated_width = delta_dilated.shape[-2:]
-            input_height, input_width = inputs.shape[-2:]
-            kernel_shape = kernel.shape[-1]
-
-            if delta_dilated_height == input_height - kernel_shape + 1 and delta_dilated_width == input_width - kernel_shape + 1:
-                # If dilated delta shape matches the needed correlation shape gradient can be computed
-                dkernel = signal.correlate2d(inputs, delta_dilated, "valid")
-            else:
-                # If dilated delta shape doesn't match the needed correlation shape padding is needed
-                new_delta_shape = (input_height - kernel_shape + 1, input_width - kernel_shape + 1)
-                delta_dilated_padded = pad_to_shape(delta_dilated, new_delta_shape)
-                dkernel = signal.correlate2d(inputs, delta_dilated_padded, "valid")
+        # Valid positions never wrap around since the transform is at least as large as the inputs
+        return output[:, :, :input_height - self.kernel_size + 1, :input_width - self.kernel_size + 1]
 
-        else:
-            # Gradient with respect to kernel is valid cross correlation between inputs and delta
-            dkernel = signal.correlate2d(inputs, delta, "valid")
-
-        return dkernel
-
-    def _calculate_input_gradient(self, inputs: np.ndarray, delta: np.ndarray, kernel: np.ndarray, stride: int = 1):
+    def _backward_fft(self, delta: np.ndarray, padded_shape: tuple) -> tuple:
         """
-        Helper method for calculating input gradient.
+        Helper method for calculating kernel and input gradients in the frequency domain.
 
         Parameters
         ----------
-        inputs : np.ndarray
-            Current sample the gradient is calculated for.
-
         delta : np.ndarray
             Accumulated gradient obtained by backpropagation.
 
-        kernel : np.ndarray
-            Kernel used in convolutional layer.
-
-        stride : int, default=1
-            Step size at which the kernel moves across the input.
+        padded_shape : tuple
+            Shape of the padded inputs.
 
         Returns
         -------
-        input_grad : np.ndarray
-            Input gradient.
+        kernel_grad, input_grad : tuple[np.ndarray, np.ndarray]
+            Kernel gradient and padded input gradient.
         """
+        input_height, input_width = padded_shape[-2:]
 
-        if stride > 1:
+        delta_fft = fft.rfftn(delta, self.fft_shape, axes=(2, 3), workers=-1)
 
-            delta_dilated = dilate(delta, stride)
+        # Gradient with respect to kernels is valid cross correlation between inputs and delta
+        dkernels_fft = np.einsum('ncij,noij->ocij', self.inputs_fft, np.conj(delta_fft), optimize=True)
+        dkernels = fft.irfftn(dkernels_fft, self.fft_shape, axes=(2, 3), workers=-1)[:, :, :self.kernel_size, :self.kernel_size]
 
-            delta_dilated_height, delta_dilated_width = delta_dilated.shape[-2:]
-            input_height, input_width = inputs.shape[-2:]
-            kernel_shape = kernel.shape[-1]
+        # Gradient with respect to inputs is full convolution between delta and kernels
+        dinputs_fft = np.einsum('noij,ocij->ncij', delta_fft, self.kernels_fft, optimize=True)
+        dinputs = fft.irfftn(dinputs_fft, self.fft_shape, axes=(2, 3), workers=-1)[:, :, :input_height, :input_width]
 
-            if delta_dilated_height == input_height - kernel_shape + 1 and delta_dilated_width == input_width - kernel_shape + 1:
-                # If dilated delta shape matches the needed coonvolution shape gradient can be computed
-                dinput = signal.convolve2d(delta_dilated, kernel, "full")
-            else:
-                # If dilated delta shape doesn't match the needed convolution shape padding is needed
-                new_delta_shape = (input_height - kernel_shape + 1, input_width - kernel_shape + 1)
-                delta_dilated_padded = pad_to_shape(delta_dilated, new_delta_shape)
-                dinput = signal.convolve2d(delta_dilated_padded, kernel, "full")
-
-        else:
-            # Gradient with respect to inputs is full convolution between delta and kernel
-            dinput = signal.convolve2d(delta, kernel, "full")
+        return dkernels, dinputs
 
-        return dinput
-    
 class MaxPoolLayer(Layer):
 
     def __init__(self, input_shape: tuple, kernel_size: int, stride: int = 1, padding: int = 0) -> None:
@@ -332,8 +354,8 @@ class MaxPoolLayer(Layer):
         self.padding = padding
 
         # Calculate output width and height
-        self.output_height = int((input_height - kernel_size + 2 * padding) / stride) + 1
-        self.output_width = int((input_width - kernel_size + 2 * padding) / stride) + 1
+        self.output_height = (input_height - kernel_size + 2 * padding) // stride + 1
+        self.output_width = (input_width - kernel_size + 2 * padding) // stride + 1
 
         # Create output shape
         self.output_shape = (self.input_channels, self.output_height, self.output_width)
@@ -351,63 +373,27 @@ class MaxPoolLayer(Layer):
         -------
         None
         """
-        
-        # List for storing indices of max elements (used in backward pass)
-        self.max_indices = []
-        
+
         # Store inputs
         self.inputs = inputs
 
-        # Number of samples, first dimenison
-        n_samples = inputs.shape[0]
-
-        # Output is 4D tensor of shape (n_samples, input_channels, width, height)
-        self.output = np.zeros((n_samples, *self.output_shape))
-
-        # Loop through every sample
-        for i in range(n_samples):
-
-            # Add empty list to max indices for the current sample
-            self.max_indices.append([])
-
-            # Loop through every channel
-            for j in range(self.input_channels):
-
-                # Add empty list to max indices for the current channel of the current sample
-                self.max_indices[i].append([])
-
-                if self.padding:
-                    arr = np.pad(self.inputs[i, j], pad_width=self.padding, mode='constant')
-                else:
-                    arr = self.inputs[i, j].copy()
-
-                # Loop through each element of the output
-                for k in range(self.output_height):
-
-                    # Initalize axis 0 start and end indices 
-                    axis_0_start = k * self.stride
-                    axis_0_end = axis_0_start + self.kernel_size
+        if self.padding:
+            inputs = np.pad(inputs, ((0, 0), (0, 0), (self.padding, self.padding), (self.padding, self.padding)), mode='constant')
 
-                    for l in range(self.output_width):
-                        
-                        # Initalize axis 1 start and end indices
-                        axis_1_start = l*self.stride
-                        axis_1_end = axis_1_start + self.kernel_size
-                            
-                        # Use axis 0 and 1 indices to obtain max pooling region   
-                        region = arr[axis_0_start:axis_0_end, axis_1_start:axis_1_end]
+        # View of every pooling region, flattened to shape (n_samples, input_channels, height, width, kernel_size * kernel_size)
+        regions = np.lib.stride_tricks.sliding_window_view(inputs, (self.kernel_size, self.kernel_size), axis=(2, 3))[:, :, ::self.stride, ::self.stride]
+        regions = regions.reshape(*regions.shape[:4], -1)
 
-                        # Get the max element from the region, save it to output
-                        self.output[i, j, k, l] = np.max(region)
-                        
-                        # Get the index of the max element within the region (region is flattened array in this case)
-                        max_index = np.argmax(region)
+        # Index of the max element within each region
+        max_index = np.argmax(regions, axis=-1)
 
-                        # Calculate the position of the max element within the sample
-                        max_element_position = (axis_0_start + (max_index // self.kernel_size), axis_1_start + (max_index % self.kernel_size))
+        # Output is 4D tensor of shape (n_samples, input_channels, height, width)
+        self.output = np.take_along_axis(regions, max_index[..., None], axis=-1)[..., 0]
 
-                        # Store the position of max element
-                        self.max_indices[i][j].append(max_element_position)
+        # Calculate the positions of max elements within the samples (used in backward pass)
+        axis_0_start = np.arange(self.output_height)[:, None] * self.stride
+        axis_1_start = np.arange(self.output_width)[None, :] * self.stride
+        self.max_indices = (axis_0_start + max_index // self.kernel_size, axis_1_start + max_index % self.kernel_size)
 
     def backward(self, delta: np.ndarray) -> None:
         """
@@ -423,35 +409,21 @@ class MaxPoolLayer(Layer):
         None
         """
 
-        # Initialize inputs gradient
-        input_shape = self.inputs.shape
-        self.dinputs = np.zeros(input_shape)
-
         # Number of samples, first dimenison
         n_samples = self.inputs.shape[0]
+        input_height, input_width = self.inputs.shape[-2:]
 
-        if self.padding:
-            dinput_height, dinput_width = input_shape[-2:]
-            dinput_shape = (dinput_height + 2 * self.padding, dinput_width + 2 * self.padding)
-        else:
-            dinput_shape = input_shape[-2:]
-
-        # Loop through samples
-        for i in range(n_samples):
-            # Loop through channels
-            for j in range(self.input_channels):
-                
-                # Initialize gradient for current sample
-                dinput = np.zeros(dinput_shape)
+        # Initialize (padded) inputs gradient
+        dinput_shape = (n_samples, self.input_channels, input_height + 2 * self.padding, input_width + 2 * self.padding)
+        self.dinputs = np.zeros(dinput_shape, dtype=delta.dtype)
 
-                # Loop through pairs of indices zipped with a delta value
-                for (k, l), d in zip(self.max_indices[i][j], delta[i, j].flatten()):
-                    dinput[k, l] = d
+        # Every delta value is routed to the position of its max element, overlapping regions accumulate
+        sample_index = np.arange(n_samples)[:, None, None, None]
+        channel_index = np.arange(self.input_channels)[None, :, None, None]
+        np.add.at(self.dinputs, (sample_index, channel_index, *self.max_indices), delta)
 
-                if self.padding:
-                    self.dinputs[i, j] = dinput[self.padding:-self.padding, self.padding:-self.padding]
-                else:
-                    self.dinputs[i, j] = dinput.copy()
+        if self.padding:
+            self.dinputs = self.dinputs[:, :, self.padding:-self.padding, self.padding:-self.padding]
 
 class ReshapeLayer(Layer):
 
@@ -461,14 +433,14 @@ class ReshapeLayer(Layer):
 
         Parameters
         ----------
-        input_shape : tuple
+        input_shape : tuple | int
             Input shape of a single sample. For images it's (channels, height, width).
 
-        output_shape : int
+        output_shape : tuple | int
             Output shape of a single sample.
         """
-        self.input_shape = input_shape
-        self.output_shape = output_shape
+        self.input_shape = (input_shape, ) if isinstance(input_shape, Integral) else tuple(input_shape)
+        self.output_shape = (output_shape, ) if isinstance(output_shape, Integral) else tuple(output_shape)
 
     def forward(self, inputs: np.ndarray) -> None:
         """
@@ -485,7 +457,8 @@ class ReshapeLayer(Layer):
         """
         # Store number of samples, first dimension
         batch_size = inputs.shape[0]
-        self.output = np.reshape(inputs, (batch_size, *self.output_shape))
+        # Reshaping a contiguous array is a view, no data is copied
+        self.output = inputs.reshape(batch_size, *self.output_shape)
 
     def backward(self, delta: np.ndarray) -> None:
         """
@@ -502,7 +475,7 @@ class ReshapeLayer(Layer):
         """
         # Store number of samples, first dimension
         batch_size = delta.shape[0]
-        self.dinputs = np.reshape(delta, (batch_size, *self.input_shape))
+        self.dinputs = delta.reshape(batch_size, *self.input_shape)
 
 class RecurrentLayer(Layer):
 
@@ -192,7 +192,8 @@ class Model:
         prediction : np.ndarray
         """
         self._forward(X)
-        return self.output
+        # Layers reuse their output arrays, so the prediction is copied to outlive the next forward pass
+        return self.output.copy()
     
     def add(self, layer : Layer | Activation) -> None:
         """